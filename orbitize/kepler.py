@@ -15,6 +15,11 @@ if cuda_ext:
     from orbitize import gpu_context
     kep_gpu_ctx = gpu_context.gpu_context()
 
+# unit conversions used by the orbit solver, evaluated once so that the per-orbit math
+# can run on plain floats instead of astropy Quantities
+_G_AU3_MSUN_DAY2 = consts.G.to(u.AU**3 / (u.Msun * u.day**2)).value  # G [au^3 / (M_sun day^2)]
+_SQRT_G_MSUN_AU_KMS = np.sqrt(consts.G * u.Msun / u.au).to(u.km / u.s).value  # sqrt(G M_sun / au) [km/s]
+
 def tau_to_manom(date, sma, mtot, tau, tau_ref_epoch):
     """
     Gets the mean anomlay
@@ -30,11 +35,7 @@ def tau_to_manom(date, sma, mtot, tau, tau_ref_epoch):
         float or np.array: mean anomaly on that date [0, 2pi)
     """
 
-    period = np.sqrt(
-        4 * np.pi**2.0 * (sma * u.AU)**3 /
-        (consts.G * (mtot * u.Msun))
-    )
-    period = period.to(u.day).value
+    period = np.sqrt(4 * np.pi**2.0 * sma**3 / (_G_AU3_MSUN_DAY2 * mtot))  # [day]
 
     frac_date = (date - tau_ref_epoch)/period
     frac_date %= 1
@@ -57,7 +58,9 @@ def calc_orbit(
     Based on orbit solvers from James Graham and Rob De Rosa. Adapted by Jason Wang and Henry Ngo.
 
     Args:
-        epochs (np.array): MJD times for which we want the positions of the planet
+        epochs (np.array): MJD times for which we want the positions of the planet.
+            Can also be a 2-D array (n_dates x n_orbs) giving a separate set of
+            epochs for each orbit.
         sma (np.array): semi-major axis of orbit [au]
         ecc (np.array): eccentricity of the orbit [0,1]
         inc (np.array): inclination [radians]
@@ -99,10 +102,17 @@ def calc_orbit(
     # Necessary for _calc_ecc_anom, for now
     if np.isscalar(epochs):  # just in case epochs is given as a scalar
         epochs = np.array([epochs])
+
+    # per-orbit epochs are already laid out as n_dates x n_orbs
+    if np.ndim(epochs) == 2:
+        n_dates = np.shape(epochs)[0]
+        dates = epochs
+    else:
+        dates = epochs[:, None]
     ecc_arr = np.tile(ecc, (n_dates, 1))
 
     # # compute mean anomaly (size: n_orbs x n_dates)
-    manom = tau_to_manom(epochs[:, None], sma, mtot, tau, tau_ref_epoch)
+    manom = tau_to_manom(dates, sma, mtot, tau, tau_ref_epoch)
     # compute eccentric anomalies (size: n_orbs x n_dates)
     eanom = _calc_ecc_anom(manom, ecc_arr, tolerance=tolerance, max_iter=max_iter, use_c=use_c, use_gpu=use_gpu)
 
@@ -128,14 +138,11 @@ def calc_orbit(
     deoff = radius * (c2i2*c1 + s2i2*c2) * plx
 
     # compute the radial velocity (vz) of the body (size: n_orbs x n_dates)
-    # first comptue the RV semi-amplitude (size: n_orbs x n_dates)
-    Kv = np.sqrt(consts.G / (1.0 - ecc**2)) * (mass_for_Kamp * u.Msun *
-                                               np.sin(inc)) / np.sqrt(mtot * u.Msun) / np.sqrt(sma * u.au)
-    # Convert to km/s
-    Kv = Kv.to(u.km/u.s)
+    # first comptue the RV semi-amplitude (size: n_orbs x n_dates) [km/s]
+    Kv = _SQRT_G_MSUN_AU_KMS * mass_for_Kamp * np.sin(inc) / np.sqrt((1.0 - ecc**2) * mtot * sma)
 
     # compute the vz
-    vz = Kv.value * (ecc*np.cos(aop) + np.cos(aop + tanom))
+    vz = Kv * (ecc*np.cos(aop) + np.cos(aop + tanom))
     # Squeeze out extra dimension (useful if n_orbs = 1, does nothing if n_orbs > 1)
     vz = np.squeeze(vz)[()]
     return raoff, deoff, vz
@@ -1,15 +1,14 @@
 import numpy as np
 import corner
 import warnings
-import itertools
 
 import astropy.units as u
-import astropy.constants as consts
 from astropy.time import Time
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import matplotlib.colors as colors
 
 from erfa import ErfaWarning
@@ -27,7 +26,291 @@ cmap = colors.LinearSegmentedColormap.from_list(
     cmap(np.linspace(0.0, 0.7, 1000))
 )
 
-def plot_corner(results, param_list=None, **corner_kwargs):
+# default random number generator used to pick which orbits to plot
+_rng = np.random.default_rng()
+
+# marker shapes for the rv data points of each instrument
+_RV_SYMBOLS = ('o','^','v','s')
+
+def _plot_tracks(ax, x, y, color):
+    """
+    Plots each row of ``y`` against ``x`` as one LineCollection, rather than
+    adding one line per row.
+
+    Args:
+        ax (matplotlib.axes.Axes): axes to plot on
+        x (np.array): x values, either shared by all rows of ``y`` (1-D) or
+            one row per track (2-D)
+        y (np.array): 2-D array of y values, one row per track
+        color (string): any valid matplotlib color string
+    """
+    x, y = np.broadcast_arrays(x, y)
+    ax.add_collection(LineCollection(np.stack([x, y], axis=-1), colors=color))
+    ax.autoscale_view()
+
+def _plot_errorbars(ax, x, y, yerr, color, **collection_kwargs):
+    """
+    Draws vertical error bars for all points as one LineCollection, rather
+    than the line, cap and bar artists created by ``ax.errorbar``.
+
+    Args:
+        ax (matplotlib.axes.Axes): axes to plot on
+        x (np.array): x values of the points
+        y (np.array): y values of the points
+        yerr (np.array): y errors of the points
+        color (string): any valid matplotlib color string
+        **collection_kwargs: any remaining keyword args are sent to
+            ``matplotlib.collections.LineCollection``
+    """
+    x, y, yerr = np.broadcast_arrays(np.asarray(x), np.asarray(y), np.asarray(yerr))
+    segments = np.stack([
+        np.stack([x, y - yerr], axis=-1),
+        np.stack([x, y + yerr], axis=-1)
+    ], axis=1)
+    ax.add_collection(LineCollection(segments, colors=color, **collection_kwargs))
+    ax.autoscale_view()
+
+def _group_indices(column):
+    """
+    Groups the rows of a data table column by value (e.g. by instrument name).
+    The values are sorted and encoded as integer codes once, so that finding
+    the rows of each value compares small integers rather than strings.
+
+    Args:
+        column (astropy.table.Column or np.array): column to group
+
+    Return:
+        dict: maps each unique value of ``column`` (as a string, in sorted order)
+        to an array of the indices of the rows with that value
+    """
+    names, codes = np.unique(np.asarray(column).astype(str), return_inverse=True)
+
+    return {name: np.flatnonzero(codes == k) for k, name in enumerate(names)}
+
+def _group_styles(groups, num_points, styles, offset=0):
+    """
+    Cycles through ``styles`` (e.g. colors or markers) to give each group of
+    points its own style, and looks up the style of every point.
+
+    Args:
+        groups (dict): maps each group name to the indices of its points, as
+            returned by ``_group_indices``
+        num_points (int): total number of points
+        styles (tuple): styles to cycle through
+        offset (int): position in ``styles`` of the style of the first group
+            (default: 0)
+
+    Return:
+        tuple:
+
+            np.array: style of each group, in the order of ``groups``
+
+            np.array: style of each point
+    """
+    group_styles = np.take(styles, np.arange(offset, offset + len(groups)) % len(styles))
+    point_styles = np.empty(num_points, dtype=group_styles.dtype)
+    for inds, style in zip(groups.values(), group_styles):
+        point_styles[inds] = style
+
+    return group_styles, point_styles
+
+
+def _scatter_by_marker(ax, x, y, colors, markers, **scatter_kwargs):
+    """
+    Scatters points with a color and marker per point, using one scatter call
+    per distinct marker rather than one per group of points.
+
+    Args:
+        ax (matplotlib.axes.Axes): axes to plot on
+        x (np.array): x values of the points
+        y (np.array): y values of the points
+        colors (np.array or string): matplotlib color string of each point, or
+            one color for all points
+        markers (np.array): matplotlib marker string of each point
+        **scatter_kwargs: any remaining keyword args are sent to ``ax.scatter``
+    """
+    colors = np.broadcast_to(colors, np.shape(markers))
+    for marker in np.unique(markers):
+        mask = markers == marker
+        ax.scatter(x[mask], y[mask], c=colors[mask], marker=marker, **scatter_kwargs)
+
+
+def _errorbar_by_color(ax, x, y, yerr, colors, **errorbar_kwargs):
+    """
+    Draws errorbars with a color per point, using one errorbar call per
+    distinct color rather than one per group of points.
+
+    Args:
+        ax (matplotlib.axes.Axes): axes to plot on
+        x (np.array): x values of the points
+        y (np.array): y values of the points
+        yerr (np.array): y errors of the points
+        colors (np.array): matplotlib color string of each point
+        **errorbar_kwargs: any remaining keyword args are sent to ``ax.errorbar``
+    """
+    for color in np.unique(colors):
+        mask = colors == color
+        ax.errorbar(x[mask], y[mask], yerr=yerr[mask], ecolor=color, **errorbar_kwargs)
+
+
+def _compute_orbit_tracks(sma, ecc, inc, aop, pan, tau, plx, mtot, start_mjd,
+                          num_epochs, sep_pa_end_mjd, tau_ref_epoch, mass_for_Kamp=None,
+                          rv_start_mjd=None):
+    """
+    Computes the orbit tracks drawn by ``plot_orbits``: one orbital period of
+    each orbit for the sky plot, all orbits over the shared epochs of the
+    Sep/PA panels, and the radial velocities of all orbits over the shared
+    epochs of the rv panels. Each orbital parameter is an array with one entry
+    per orbit.
+
+    Args:
+        sma, ecc, inc, aop, pan, tau, plx, mtot (np.array): orbital parameters
+            of each orbit, in the units taken by ``orbitize.kepler.calc_orbit``
+        start_mjd (float): MJD in which to start the orbit tracks
+        num_epochs (int): number of points in each orbit track
+        sep_pa_end_mjd (float): MJD in which to stop the Sep/PA orbit tracks
+        tau_ref_epoch (float): reference epoch for defining tau
+        mass_for_Kamp (np.array): mass used to compute the radial velocity
+            semi-amplitude (default: None, see ``orbitize.kepler.calc_orbit``)
+        rv_start_mjd (float): MJD in which to start the rv tracks, which end at
+            ``sep_pa_end_mjd`` (default: None, which uses the Sep/PA epochs)
+
+    Returns:
+        tuple:
+
+            raoff (np.array): (n_orbs x num_epochs) RA offsets over one orbital period [mas]
+
+            deoff (np.array): (n_orbs x num_epochs) Dec offsets over one orbital period [mas]
+
+            epochs (np.array): (n_orbs x num_epochs) epochs of ``raoff`` and ``deoff`` [mjd]
+
+            raoff_seppa (np.array): (n_orbs x num_epochs) RA offsets at ``epochs_seppa`` [mas]
+
+            deoff_seppa (np.array): (n_orbs x num_epochs) Dec offsets at ``epochs_seppa`` [mas]
+
+            vz (np.array): (n_orbs x num_epochs) radial velocities at ``epochs_rv`` [km/s]
+
+            epochs_seppa (np.array): epochs of the Sep/PA orbit tracks, shared by all orbits [mjd]
+
+            epochs_rv (np.array): epochs of the rv orbit tracks, shared by all orbits [mjd]
+    """
+    num_orbits = np.size(sma)
+
+    # Compute period in days (from Kepler's third law)
+    period = np.sqrt(4*np.pi**2.0*sma**3/(kepler._G_AU3_MSUN_DAY2*mtot))
+
+    # Create an epochs array to plot num_epochs points over one orbital period
+    # (one row per orbit, since epochs[] vary for each orbit)
+    epochs = np.linspace(start_mjd, start_mjd + period, num_epochs, axis=1)
+
+    # every orbit shares the same epochs in the sep/PA panels, and in the rv panels
+    epochs_seppa = np.linspace(start_mjd, sep_pa_end_mjd, num_epochs)
+    all_epochs = [
+        epochs.T, np.broadcast_to(epochs_seppa[:, None], (num_epochs, num_orbits))
+    ]
+    if rv_start_mjd is None:
+        epochs_rv = epochs_seppa
+    else:
+        epochs_rv = np.linspace(rv_start_mjd, sep_pa_end_mjd, num_epochs)
+        all_epochs.append(np.broadcast_to(epochs_rv[:, None], (num_epochs, num_orbits)))
+    num_grids = len(all_epochs)
+
+    # Solve all sets of tracks in a single call to calc_orbit, which takes
+    # and returns arrays of shape (n_dates x n_orbs)
+    raoff, deoff, vz = kepler.calc_orbit(
+        np.concatenate(all_epochs), sma, ecc, inc, aop, pan, tau, plx, mtot,
+        mass_for_Kamp=mass_for_Kamp, tau_ref_epoch=tau_ref_epoch
+    )
+    raoff = np.reshape(raoff, (num_grids, num_epochs, num_orbits)).transpose(0, 2, 1)
+    deoff = np.reshape(deoff, (num_grids, num_epochs, num_orbits)).transpose(0, 2, 1)
+    vz = np.reshape(vz, (num_grids, num_epochs, num_orbits)).transpose(0, 2, 1)
+
+    return raoff[0], deoff[0], epochs, raoff[1], deoff[1], vz[-1], epochs_seppa, epochs_rv
+
+
+def _rv_trend(epochs, sma, ecc, inc, aop, pan, tau, plx, m0, m1, tau_ref_epoch):
+    """
+    Computes the radial velocity of the primary over a grid of epochs for a
+    single orbit, e.g. the orbit with the best log probability.
+
+    Args:
+        epochs (np.array): epochs at which to compute the radial velocity [mjd]
+        sma, ecc, inc, aop, pan, tau, plx (float): orbital parameters of the
+            orbit, in the units taken by ``orbitize.kepler.calc_orbit``
+        m0 (float): mass of the primary [Msol]
+        m1 (float): mass of the companion [Msol]
+        tau_ref_epoch (float): reference epoch for defining tau
+
+    Return:
+        np.array: radial velocity of the primary at each epoch [km/s]
+    """
+    _, _, vz = kepler.calc_orbit(
+        epochs, sma, ecc, inc, aop, pan, tau, plx, m0 + m1,
+        mass_for_Kamp=m0, tau_ref_epoch=tau_ref_epoch
+    )
+
+    # scale to the RV semi-amplitude of the primary
+    return -vz * m1 / m0
+
+
+def _plot_best_rv_trend(ax, epochs, yr_epochs, best_post, orbit_cols, best_m0, best_m1,
+                        best_gamma, tau_ref_epoch, color='black'):
+    """
+    Plots the radial velocity of the primary predicted by the orbit with the
+    best log probability.
+
+    Args:
+        ax (matplotlib.axes.Axes): axes to plot on
+        epochs (np.array): epochs at which to plot the radial velocity [mjd]
+        yr_epochs (np.array): ``epochs`` in decimal years
+        best_post (np.array): best orbit, in the standard basis
+        orbit_cols (list): positions in ``best_post`` of the sma, ecc, inc,
+            aop, pan, tau and plx of the plotted companion
+        best_m0 (float): mass of the primary in the best orbit [Msol]
+        best_m1 (float): mass of the companion in the best orbit [Msol]
+        best_gamma (float): rv offset of the primary instrument in the best orbit [km/s]
+        tau_ref_epoch (float): reference epoch for defining tau
+        color (string): any valid matplotlib color string (default: 'black')
+    """
+    vz = _rv_trend(epochs, *best_post[orbit_cols], best_m0, best_m1, tau_ref_epoch)
+    ax.plot(yr_epochs, vz + best_gamma, color=color, zorder=4)
+
+
+def _prepare_rv_context(results, rv_data):
+    """
+    Collects what both rv panels of ``plot_orbits`` need from the rv data of
+    the primary and from the orbit with the best log probability, so that it
+    is only worked out once.
+
+    Args:
+        results (orbitize.results.Results): results to plot
+        rv_data (astropy.table.Table): rv rows of the primary in ``results.data``
+
+    Return:
+        tuple:
+
+            dict: maps each rv instrument name to the indices of its rows in
+            ``rv_data`` (``{'defrv': []}`` if there are no rv rows)
+
+            np.array: best orbit, converted to the standard basis
+    """
+    # indices corresponding to each instrument in the datafile
+    inds = _group_indices(rv_data['instrument'])
+    if len(inds) == 0:
+        inds = {'defrv': np.array([], dtype=int)}
+
+    # choose the orbit with the best log probability
+    best_like = int(np.argmax(results.lnlike))
+
+    # Get the posteriors for this index and convert to standard basis. The
+    # conversion is done in place and a single row of results.post is a view,
+    # so this one copy is needed to leave results.post untouched
+    best_post = results.basis.to_standard_basis(results.post[best_like].copy())
+
+    return inds, best_post
+
+
+def plot_corner(results, param_list=None, max_samples=50000, **corner_kwargs):
     """
     Make a corner plot of posterior on orbit fit from any sampler
 
@@ -54,6 +337,10 @@ def plot_corner(results, param_list=None, **corner_kwargs):
                 mi: mass of individual body i, for i = 0, 1, 2, ... (only if fit_secondary_mass == True)
                 mtot: total mass (only if fit_secondary_mass == False)
 
+        max_samples (int): maximum number of posterior samples to plot. Longer
+            posteriors are thinned by keeping every n-th sample, which keeps
+            the corner plot fast for long chains (default: 50000). Set to
+            None to plot every sample.
         **corner_kwargs: any remaining keyword args are sent to ``corner.corner``.
                             See `here <https://corner.readthedocs.io/>`_.
                             Note: default axis labels used unless overwritten by user input.
@@ -100,30 +387,38 @@ def plot_corner(results, param_list=None, **corner_kwargs):
     if param_list is None:
         param_list = results.labels
 
-    param_indices = []
-    angle_indices = []
-    secondary_mass_indices = []
-    for i, param in enumerate(param_list):
-        index_num = results.param_idx[param]
-
-        # only plot non-fixed parameters
-        if np.std(results.post[:, index_num]) > 0:
-            param_indices.append(index_num)
-            label_key = param
-            if label_key.startswith('aop') or label_key.startswith('pan') or label_key.startswith('inc'):
-                angle_indices.append(i)
-            if label_key.startswith('m') and label_key != 'm0' and label_key != 'mtot':
-                secondary_mass_indices.append(i)
-
-    samples = np.copy(results.post[:, param_indices])  # keep only chains for selected parameters
-    samples[:, angle_indices] = np.degrees(
-        samples[:, angle_indices])  # convert angles from rad to deg
-    samples[:, secondary_mass_indices] *= u.solMass.to(u.jupiterMass) # convert to Jupiter masses for companions
+    param_indices = np.array([results.param_idx[param] for param in param_list])
+    param_names = np.array(param_list)
+
+    # thin long posteriors with a strided view, which doesn't copy the chains
+    post = results.post
+    if max_samples is not None and len(post) > max_samples:
+        step = -(-len(post) // max_samples)  # ceiling division
+        post = post[::step]
+
+    # only plot non-fixed parameters
+    not_fixed = np.std(post[:, param_indices], axis=0) > 0
+    param_indices = param_indices[not_fixed]
+    param_names = param_names[not_fixed]
+
+    angle_mask = (
+        np.char.startswith(param_names, 'aop') |
+        np.char.startswith(param_names, 'pan') |
+        np.char.startswith(param_names, 'inc')
+    )
+    secondary_mass_mask = (
+        np.char.startswith(param_names, 'm') & (param_names != 'm0') & (param_names != 'mtot')
+    )
+
+    # keep only chains for selected parameters, in single precision
+    samples = post[:, param_indices].astype(np.float32)
+    samples[:, angle_mask] = np.degrees(
+        samples[:, angle_mask])  # convert angles from rad to deg
+    samples[:, secondary_mass_mask] *= u.solMass.to(u.jupiterMass) # convert to Jupiter masses for companions
 
     if 'labels' not in corner_kwargs:  # use default labels if user didn't already supply them
         reduced_labels_list = []
-        for i in np.arange(len(param_indices)):
-            label_key = param_list[i]
+        for label_key in param_names:
             if label_key.startswith("m") and label_key != 'm0' and label_key != 'mtot':
                 body_num = label_key[1]
                 label_key = "m"
@@ -151,7 +446,8 @@ def plot_orbits(results, object_to_plot=1, start_mjd=51544.,
                 sep_pa_color='lightgrey', sep_pa_end_year=2025.0,
                 cbar_param='Epoch [year]', mod180=False, rv_time_series=False, 
                 rv_time_series2=False, plot_astrometry=True,
-                plot_astrometry_insts=False, primary_instrument_name=None, fontsize=20, fig=None):
+                plot_astrometry_insts=False, primary_instrument_name=None, fontsize=20, fig=None,
+                rng=None, plot_best_orbit=False):
     """
     Plots one orbital period for a select number of fitted orbits
     for a given object, with line segments colored according to time
@@ -182,6 +478,13 @@ def plot_orbits(results, object_to_plot=1, start_mjd=51544.,
         plot_astrometry_insts (Boolean): set to False by default. Plots the astrometric data by instruments.
         fig (matplotlib.pyplot.Figure): optionally include a predefined Figure object to plot the orbit on.
             Most users will not need this keyword. 
+        rng (numpy.random.Generator): optionally include a seeded Generator used to
+            pick which orbits to plot, for reproducible plots (default: None, which
+            uses a module-level Generator). Note that the module-level Generator
+            ignores ``np.random.seed``; pass ``rng`` to make plots reproducible.
+        plot_best_orbit (Boolean): if True and rv_time_series is True, also plots the rv
+            curve of the primary predicted by the orbit with the best log probability
+            (default: False).
 
     Return:
         ``matplotlib.pyplot.Figure``: the orbit plot if input is valid, ``None`` otherwise
@@ -205,7 +508,11 @@ def plot_orbits(results, object_to_plot=1, start_mjd=51544.,
     with warnings.catch_warnings():
         warnings.simplefilter('ignore', ErfaWarning)
 
-        data = results.data[results.data['object'] == object_to_plot]
+        # masks on the data table used to select the data of each body below
+        obj_col = np.asarray(results.data['object'])
+        rv_mask = np.asarray(results.data['quant_type'] == 'rv')
+
+        data = results.data[obj_col == object_to_plot]
         possible_cbar_params = [
             'sma',
             'ecc',
@@ -228,95 +535,77 @@ def plot_orbits(results, object_to_plot=1, start_mjd=51544.,
         num_orbits = len(results.post[:, 0])
         if num_orbits_to_plot > num_orbits:
             num_orbits_to_plot = num_orbits
-        choose = np.random.randint(0, high=num_orbits, size=num_orbits_to_plot)
+        if rng is None:
+            rng = _rng
+        # draw without replacement so that no orbit is plotted twice
+        choose = rng.choice(num_orbits, size=num_orbits_to_plot, replace=False)
 
         # Get posteriors from random indices
-        standard_post = []
         if results.sampler_name == 'MCMC':
             # Convert the randomly chosen posteriors to standard keplerian set
-            for i in np.arange(num_orbits_to_plot):
-                orb_ind = choose[i]
-                param_set = np.copy(results.post[orb_ind])
-                standard_post.append(results.basis.to_standard_basis(param_set))
+            standard_post = results.basis.to_standard_basis(results.post[choose].T).T
         else: # For OFTI, posteriors are already converted
-            for i in np.arange(num_orbits_to_plot):
-                orb_ind = choose[i]
-                standard_post.append(results.post[orb_ind])
-
-        standard_post = np.array(standard_post)
-
-        sma = standard_post[:, results.standard_param_idx['sma{}'.format(object_to_plot)]]
-        ecc = standard_post[:, results.standard_param_idx['ecc{}'.format(object_to_plot)]]
-        inc = standard_post[:, results.standard_param_idx['inc{}'.format(object_to_plot)]]
-        aop = standard_post[:, results.standard_param_idx['aop{}'.format(object_to_plot)]]
-        pan = standard_post[:, results.standard_param_idx['pan{}'.format(object_to_plot)]]
-        tau = standard_post[:, results.standard_param_idx['tau{}'.format(object_to_plot)]]
-        plx = standard_post[:, results.standard_param_idx['plx']]
+            standard_post = results.post[choose]
+
+        # Get the orbital elements of the object to plot
+        orbit_cols = [
+            results.standard_param_idx['{}{}'.format(elem, object_to_plot)]
+            for elem in ['sma', 'ecc', 'inc', 'aop', 'pan', 'tau']
+        ]
+        orbit_cols.append(results.standard_param_idx['plx'])
+        sma, ecc, inc, aop, pan, tau, plx = np.take(standard_post.T, orbit_cols, axis=0)
         
         # test gamma 3
         if rv_time_series:
             # guess the instrument name if this is not specified
             if primary_instrument_name == None:
-                primary_instrument_name = results.data[results.data['object']==0]['instrument'][0]
+                primary_instrument_name = results.data[obj_col == 0]['instrument'][0]
             gamma3 = standard_post[:, results.standard_param_idx['gamma_'+primary_instrument_name]]
         
         if (rv_time_series == True) or (rv_time_series2 == True):
-            rv_data = results.data[results.data['object'] == 0]
-            rv_data = rv_data[rv_data['quant_type'] == 'rv']
-            
-            # get list of rv instruments
-            insts = np.unique(rv_data['instrument'])
-            if len(insts) == 0:
-                insts = ['defrv']
-            
-            # get gamma/sigma labels and corresponding positions in the posterior
-            gams=['gamma_'+inst for inst in insts]
+            rv_data = results.data[(obj_col == 0) & rv_mask]
+            rv_yr_epochs = Time(rv_data['epoch'], format='mjd').decimalyear
 
-            if isinstance(results.labels,list):
-                labels=np.array(results.labels)
-            else:
-                labels=results.labels
-            
-            # get the indices corresponding to each gamma within results.labels
-            gam_idx=[np.where(labels==inst_gamma)[0] for inst_gamma in gams]
-            
-            gamma = standard_post[:, gam_idx]
-            
-            if (rv_time_series == True) and (rv_time_series2 == True):
-                gamma2 = gamma.reshape(sma.shape)
+            # shared by the primary and secondary rv panels
+            inds, best_post = _prepare_rv_context(results, rv_data)
+
+            # no instrument legend when there are only default rv instruments
+            show_rv_legend = not (len(inds) == 1 and 'defrv' in inds)
+
+        if (rv_time_series2 == True):
+            rv_data2 = results.data[(obj_col == 1) & rv_mask]
+            rv2_yr_epochs = Time(rv_data2['epoch'], format='mjd').decimalyear
 
         # Then, get the other parameters
         if 'mtot' in results.labels:
             mtot = standard_post[:, results.standard_param_idx['mtot']]
         elif 'm0' in results.labels:
-            m0 = standard_post[:, results.standard_param_idx['m0']]
-            m1 = standard_post[:, results.standard_param_idx['m{}'.format(object_to_plot)]]
+            # look up the mass indices once; they are reused for the best orbit
+            m0_idx = results.standard_param_idx['m0']
+            m1_idx = results.standard_param_idx['m{}'.format(object_to_plot)]
+            m0 = standard_post[:, m0_idx]
+            m1 = standard_post[:, m1_idx]
             mtot = m0 + m1
 
-        raoff = np.zeros((num_orbits_to_plot, num_epochs_to_plot))
-        deoff = np.zeros((num_orbits_to_plot, num_epochs_to_plot))
-        vz_star = np.zeros((num_orbits_to_plot, num_epochs_to_plot))
-        epochs = np.zeros((num_orbits_to_plot, num_epochs_to_plot))
-
-        # Loop through each orbit to plot and calcualte ra/dec offsets for all points in orbit
-        # Need this loops since epochs[] vary for each orbit, unless we want to just plot the same time period for all orbits
-        for i in np.arange(num_orbits_to_plot):
-            # Compute period (from Kepler's third law)
-            period = np.sqrt(4*np.pi**2.0*(sma*u.AU)**3/(consts.G*(mtot*u.Msun)))
-            period = period.to(u.day).value
-
-            # Create an epochs array to plot num_epochs_to_plot points over one orbital period
-            epochs[i, :] = np.linspace(start_mjd, float(
-                start_mjd+period[i]), num_epochs_to_plot)
-
-            # Calculate ra/dec offsets for all epochs of this orbit
-            raoff0, deoff0, _ = kepler.calc_orbit(
-                epochs[i, :], sma[i], ecc[i], inc[i], aop[i], pan[i],
-                tau[i], plx[i], mtot[i], tau_ref_epoch=results.tau_ref_epoch
-            )
-
-            raoff[i, :] = raoff0
-            deoff[i, :] = deoff0
+        # Solve for the orbit tracks of all plotted orbits before any plotting
+        end_mjd = Time(sep_pa_end_year, format='decimalyear').mjd
+        # the rv tracks start 3 years before the first rv point of the panel below
+        if (rv_time_series == True) or (rv_time_series2 == True):
+            mass_for_Kamp = m0
+            if rv_time_series:
+                rv_start_mjd = rv_data['epoch'][0] - 3*365
+            else:
+                rv_start_mjd = rv_data2['epoch'][0] - 3*365
+        else:
+            mass_for_Kamp = None
+            rv_start_mjd = None
+        (
+            raoff, deoff, epochs, raoff_seppa, deoff_seppa, vz, epochs_seppa, epochs_rv
+        ) = _compute_orbit_tracks(
+            sma, ecc, inc, aop, pan, tau, plx, mtot, start_mjd, num_epochs_to_plot,
+            end_mjd, results.tau_ref_epoch, mass_for_Kamp=mass_for_Kamp,
+            rv_start_mjd=rv_start_mjd
+        )
 
         # Create a linearly increasing colormap for our range of epochs
         if cbar_param not in ['Epoch [year]', 'Epoch (year)']:
@@ -377,6 +666,7 @@ def plot_orbits(results, object_to_plot=1, start_mjd=51544.,
         
         astr_inds=np.where((~np.isnan(data['quant1'])) & (~np.isnan(data['quant2'])))
         astr_epochs=data['epoch'][astr_inds]
+        astr_yr_epochs=Time(astr_epochs, format='mjd').decimalyear
 
         radec_inds = np.where(data['quant_type'] == 'radec')
         seppa_inds = np.where(data['quant_type'] == 'seppa')
@@ -384,67 +674,76 @@ def plot_orbits(results, object_to_plot=1, start_mjd=51544.,
         sep_data, sep_err=data['quant1'][seppa_inds],data['quant1_err'][seppa_inds]
         pa_data, pa_err=data['quant2'][seppa_inds],data['quant2_err'][seppa_inds]
 
-        if len(radec_inds[0] > 0):
+        if len(radec_inds[0]) > 0:
 
             sep_from_ra_data, pa_from_dec_data = orbitize.system.radec2seppa(
                 data['quant1'][radec_inds], data['quant2'][radec_inds]
             )
 
-            num_radec_pts = len(radec_inds[0])
-            sep_err_from_ra_data = np.empty(num_radec_pts)
-            pa_err_from_dec_data = np.empty(num_radec_pts)
-            for j in np.arange(num_radec_pts):
-
-                sep_err_from_ra_data[j], pa_err_from_dec_data[j], _ = orbitize.system.transform_errors(
-                    np.array(data['quant1'][radec_inds][j]), np.array(data['quant2'][radec_inds][j]), 
-                    np.array(data['quant1_err'][radec_inds][j]), np.array(data['quant2_err'][radec_inds][j]), 
-                    np.array(data['quant12_corr'][radec_inds][j]), orbitize.system.radec2seppa
-                )
+            sep_err_from_ra_data, pa_err_from_dec_data, _ = orbitize.system.transform_errors(
+                np.asarray(data['quant1'][radec_inds]), np.asarray(data['quant2'][radec_inds]),
+                np.asarray(data['quant1_err'][radec_inds]), np.asarray(data['quant2_err'][radec_inds]),
+                np.asarray(data['quant12_corr'][radec_inds]), orbitize.system.radec2seppa
+            )
 
-            sep_data = np.append(sep_data, sep_from_ra_data)
-            sep_err = np.append(sep_err, sep_err_from_ra_data)
+            # seppa points first, then the points converted from radec
+            sep_data = np.concatenate([sep_data, sep_from_ra_data])
+            sep_err = np.concatenate([sep_err, sep_err_from_ra_data])
 
-            pa_data = np.append(pa_data, pa_from_dec_data)
-            pa_err = np.append(pa_err, pa_err_from_dec_data)
+            pa_data = np.concatenate([pa_data, pa_from_dec_data])
+            pa_err = np.concatenate([pa_err, pa_err_from_dec_data])
 
         # For plotting different astrometry instruments
         if plot_astrometry_insts:
             astr_colors = ('#FF7F11', '#11FFE3', '#14FF11', '#7A11FF', '#FF1919')
             astr_symbols = ('*', 'o', 'p', 's')
 
-            ax_colors = itertools.cycle(astr_colors)
-            ax_symbols = itertools.cycle(astr_symbols)
-
             astr_data = data[astr_inds]
-            astr_insts = np.unique(data[astr_inds]['instrument'])
 
             # Indices corresponding to each instrument in datafile
-            astr_inst_inds = {}
-            for i in range(len(astr_insts)):
-                astr_inst_inds[astr_insts[i]]=np.where(astr_data['instrument']==astr_insts[i].encode())[0]
-
-        # Plot each orbit (each segment between two points coloured using colormap)
-        for i in np.arange(num_orbits_to_plot):
-            points = np.array([raoff[i, :], deoff[i, :]]).T.reshape(-1, 1, 2)
-            segments = np.concatenate([points[:-1], points[1:]], axis=1)
-            lc = LineCollection(
-                segments, cmap=cmap, norm=norm, linewidth=1.0
+            astr_inst_inds = _group_indices(astr_data['instrument'])
+            astr_insts = list(astr_inst_inds.keys())
+
+            # color and marker of each instrument and of each of its points,
+            # so that points can be plotted one marker at a time
+            astr_inst_colors, astr_point_colors = _group_styles(
+                astr_inst_inds, len(astr_data), astr_colors
+            )
+            astr_inst_symbols, astr_point_symbols = _group_styles(
+                astr_inst_inds, len(astr_data), astr_symbols
             )
-            if cbar_param not in ['Epoch [year]', 'Epoch (year)']:
-                lc.set_array(np.ones(len(epochs[0]))*cbar_param_arr[i])
-            elif cbar_param in ['Epoch [year]', 'Epoch (year)']:
-                lc.set_array(epochs[i, :])
-            ax.add_collection(lc)
+
+            # legend entries, one per instrument
+            astr_handles = [
+                Line2D(
+                    [], [], linestyle='', markersize=np.sqrt(10), markeredgewidth=1.5,
+                    marker=m, color=c, label=inst
+                )
+                for inst, c, m in zip(astr_insts, astr_inst_colors, astr_inst_symbols)
+            ]
+
+        # Plot all orbits (each segment between two points coloured using colormap)
+        # as a single LineCollection of shape (num_orbits_to_plot*(num_epochs_to_plot-1), 2, 2)
+        points = np.stack([raoff, deoff], axis=-1)
+        segments = np.stack([points[:, :-1], points[:, 1:]], axis=2).reshape(-1, 2, 2)
+        lc = LineCollection(
+            segments, cmap=cmap, norm=norm, linewidth=1.0
+        )
+        if cbar_param not in ['Epoch [year]', 'Epoch (year)']:
+            lc.set_array(np.repeat(cbar_param_arr[:num_orbits_to_plot], num_epochs_to_plot - 1))
+        elif cbar_param in ['Epoch [year]', 'Epoch (year)']:
+            lc.set_array(epochs[:, :-1].ravel())
+        ax.add_collection(lc)
 
         if plot_astrometry:
             ra_data,dec_data=orbitize.system.seppa2radec(sep_data,pa_data)
 
             # Plot astrometry along with instruments
             if plot_astrometry_insts:
-                for i in range(len(astr_insts)):
-                    ra = ra_data[astr_inst_inds[astr_insts[i]]]
-                    dec = dec_data[astr_inst_inds[astr_insts[i]]]
-                    ax.scatter(ra, dec, marker=next(ax_symbols), c=next(ax_colors), zorder=10, s=60, label=astr_insts[i])
+                _scatter_by_marker(
+                    ax, ra_data, dec_data, astr_point_colors, astr_point_symbols,
+                    zorder=10, s=60
+                )
             else:
                 ax.scatter(ra_data, dec_data, marker='*', c='red', zorder=10, s=60)
 
@@ -505,286 +804,137 @@ def plot_orbits(results, object_to_plot=1, start_mjd=51544.,
             ax1.set_ylabel('$\\rho$ (mas)', fontsize=fontsize)
             ax2.set_xlabel('Epoch', fontsize=fontsize)
 
-        if plot_astrometry_insts:
-            ax1_colors = itertools.cycle(astr_colors)
-            ax1_symbols = itertools.cycle(astr_symbols)
+        yr_epochs = Time(epochs_seppa, format='mjd').decimalyear
 
-            ax2_colors = itertools.cycle(astr_colors)
-            ax2_symbols = itertools.cycle(astr_symbols)
+        seps, pas = orbitize.system.radec2seppa(raoff_seppa, deoff_seppa, mod180=mod180)
 
-        epochs_seppa = np.zeros((num_orbits_to_plot, num_epochs_to_plot))
+        _plot_tracks(ax1, yr_epochs, seps, sep_pa_color)
+        _plot_tracks(ax2, yr_epochs, pas, sep_pa_color)
 
-        for i in np.arange(num_orbits_to_plot):
+        # plot RV orbits here
+        if (rv_time_series == True) or (rv_time_series2 == True):
+            yr_epochs_rv = Time(epochs_rv,format='mjd').decimalyear
 
-            epochs_seppa[i, :] = np.linspace(
-                start_mjd,
-                Time(sep_pa_end_year, format='decimalyear').mjd,
-                num_epochs_to_plot
-            )
+        if (rv_time_series == True):
+            # scale back to primary RV semi amplitude
+            vz0 = vz*(-(mtot-m0)/m0)[:, None]
 
-            # Calculate ra/dec offsets for all epochs of this orbit
-            if (rv_time_series == True) or (rv_time_series2 == True):
-                raoff0, deoff0, vz = kepler.calc_orbit(
-                    epochs_seppa[i, :], sma[i], ecc[i], inc[i], aop[i], pan[i],
-                    tau[i], plx[i], mtot[i], tau_ref_epoch=results.tau_ref_epoch,
-                    mass_for_Kamp=m0[i]
-                )
+            _plot_tracks(ax3, yr_epochs_rv, vz0+gamma3[:, None], sep_pa_color)
 
-                raoff[i, :] = raoff0
-                deoff[i, :] = deoff0
+        if (rv_time_series2 == True):
+            if rv_time_series:
+                _plot_tracks(ax4, yr_epochs_rv, vz, sep_pa_color)
             else:
-                raoff0, deoff0, _ = kepler.calc_orbit(
-                    epochs_seppa[i, :], sma[i], ecc[i], inc[i], aop[i], pan[i],
-                    tau[i], plx[i], mtot[i], tau_ref_epoch=results.tau_ref_epoch
-                )
-
-                raoff[i, :] = raoff0
-                deoff[i, :] = deoff0
-
-            yr_epochs = Time(epochs_seppa[i, :], format='mjd').decimalyear
-
-            seps, pas = orbitize.system.radec2seppa(raoff[i, :], deoff[i, :], mod180=mod180)
-
-            plt.sca(ax1)
-            plt.plot(yr_epochs, seps, color=sep_pa_color)
-
-            plt.sca(ax2)
-            plt.plot(yr_epochs, pas, color=sep_pa_color)
-            
-            # plot RV orbits here
-            if (rv_time_series == True):
-                plt.sca(ax3)
-                
-                # scale back to primary RV semi amplitude
-                vz0=vz*(-(mtot[i]-m0[i])/np.median(m0[i]))
-                
-                epochs_rv = np.linspace(rv_data['epoch'][0]-3*365, epochs_seppa[0,-1], num_epochs_to_plot)
-                
-                plt.plot(Time(epochs_rv,format='mjd').decimalyear, vz0+gamma3[i], color=sep_pa_color)
-            
-            if (rv_time_series2 == True):
-                if (rv_time_series == True):
-                    plt.sca(ax4)
-                else:
-                    plt.sca(ax3)
-                
-                # scale back to primary RV semi amplitude
-                if rv_time_series:
-                    epochs_rv = np.linspace(rv_data['epoch'][0]-3*365, epochs_seppa[0,-1], num_epochs_to_plot)
-                
-                    plt.plot(Time(epochs_rv,format='mjd').decimalyear, vz, color=sep_pa_color)
-                else:
-                    rv_data2 = results.data[results.data['object'] == 1]
-                    rv_data2 = rv_data2[rv_data2['quant_type'] == 'rv']
-                    
-                    epochs_rv2 = np.linspace(rv_data2['epoch'][0]-3*365, epochs_seppa[0,-1], num_epochs_to_plot)
-                
-                    plt.plot(Time(epochs_rv2,format='mjd').decimalyear, vz, color=sep_pa_color)
-                
+                _plot_tracks(ax3, yr_epochs_rv, vz, sep_pa_color)
 
         # Plot sep/pa instruments
         if plot_astrometry_insts:
-            for i in range(len(astr_insts)):
-                sep = sep_data[astr_inst_inds[astr_insts[i]]]
-                pa = pa_data[astr_inst_inds[astr_insts[i]]]
-                epochs = astr_epochs[astr_inst_inds[astr_insts[i]]]
-                
-                serr = sep_err[astr_inst_inds[astr_insts[i]]]
-                perr = pa_err[astr_inst_inds[astr_insts[i]]]
-                
-                plt.sca(ax1)
-                plt.scatter(Time(epochs,format='mjd').decimalyear,sep,s=10,marker=next(ax1_symbols),c=next(ax1_colors),zorder=10,label=astr_insts[i])
-                plt.errorbar(Time(epochs,format='mjd').decimalyear,sep,yerr=serr,ms=5, linestyle='', ecolor=next(ax1_colors),zorder=10, capsize=2)
-                plt.sca(ax2)
-                plt.scatter(Time(epochs,format='mjd').decimalyear,pa,s=10,marker=next(ax2_symbols),c=next(ax2_colors),zorder=10)
-                plt.errorbar(Time(epochs,format='mjd').decimalyear,pa,yerr=perr,ms=5, linestyle='',marker=next(ax2_symbols),ecolor=next(ax2_colors),zorder=10, capsize=2)
-            plt.sca(ax1)
-            plt.legend(title='Instruments', bbox_to_anchor=(1.3, 1), loc='upper right')
+            # same color and marker for an instrument in every panel
+            _scatter_by_marker(
+                ax1, astr_yr_epochs, sep_data, astr_point_colors, astr_point_symbols,
+                s=10, zorder=10
+            )
+            _errorbar_by_color(
+                ax1, astr_yr_epochs, sep_data, sep_err, astr_point_colors,
+                ms=5, linestyle='', zorder=10, capsize=2
+            )
+            _scatter_by_marker(
+                ax2, astr_yr_epochs, pa_data, astr_point_colors, astr_point_symbols,
+                s=10, zorder=10
+            )
+            _errorbar_by_color(
+                ax2, astr_yr_epochs, pa_data, pa_err, astr_point_colors,
+                ms=5, linestyle='', zorder=10, capsize=2
+            )
+            ax1.legend(handles=astr_handles, title='Instruments', bbox_to_anchor=(1.3, 1), loc='upper right')
         else:
-            plt.sca(ax1)
-            plt.scatter(Time(astr_epochs,format='mjd').decimalyear,sep_data,s=60,marker='*',c='red',zorder=10)
-            plt.errorbar(Time(astr_epochs,format='mjd').decimalyear,sep_data,yerr=sep_err,ms=5, linestyle='', ecolor='red',zorder=10, capsize=2)
-            plt.sca(ax2)
-            plt.scatter(Time(astr_epochs,format='mjd').decimalyear,pa_data,s=60,marker='*',c='red',zorder=10)
-            plt.errorbar(Time(astr_epochs,format='mjd').decimalyear,pa_data,yerr=pa_err,ms=5, linestyle='',ecolor='red',zorder=10, capsize=2)
-
-        if (rv_time_series == True):
-
-            rv_data = results.data[results.data['object'] == 0]
-            rv_data = rv_data[rv_data['quant_type'] == 'rv']
-
-            # switch current axis to rv panel
-            plt.sca(ax3)
-    
-            # get list of rv instruments
-            insts = np.unique(rv_data['instrument'])
-            if len(insts) == 0:
-                insts = ['defrv']
-
-            # get gamma/sigma labels and corresponding positions in the posterior
-            gams=['gamma_'+inst for inst in insts]
-
-            if isinstance(results.labels,list):
-                labels=np.array(results.labels)
-            else:
-                labels=results.labels
-            
-            # get the indices corresponding to each gamma within results.labels
-            gam_idx=[np.where(labels==inst_gamma)[0] for inst_gamma in gams]
-
-            # indices corresponding to each instrument in the datafile
-            inds={}
-            for i in range(len(insts)):
-                inds[insts[i]]=np.where(rv_data['instrument']==insts[i].encode())[0]
-
-            # choose the orbit with the best log probability
-            best_like=np.where(results.lnlike==np.amax(results.lnlike))[0][0]
-            
-            med_ga=[results.post[best_like,i] for i in gam_idx]
-
-            # Get the posteriors for this index and convert to standard basis
-            best_post = results.basis.to_standard_basis(results.post[best_like].copy())
+            ax1.scatter(astr_yr_epochs,sep_data,s=60,marker='*',c='red',zorder=10)
+            ax1.errorbar(astr_yr_epochs,sep_data,yerr=sep_err,ms=5, linestyle='', ecolor='red',zorder=10, capsize=2)
+            ax2.scatter(astr_yr_epochs,pa_data,s=60,marker='*',c='red',zorder=10)
+            ax2.errorbar(astr_yr_epochs,pa_data,yerr=pa_err,ms=5, linestyle='',ecolor='red',zorder=10, capsize=2)
 
+        if (rv_time_series == True) or (rv_time_series2 == True):
             # Get the masses for the best posteriors:
-            best_m0 = best_post[results.standard_param_idx['m0']]
-            best_m1 = best_post[results.standard_param_idx['m{}'.format(object_to_plot)]]
-            best_mtot = best_m0 + best_m1
-
-            # colour/shape scheme scheme for rv data points
-            clrs=('#0496FF','#372554','#FF1053','#3A7CA5','#143109')
-            symbols=('o','^','v','s')
-
-            ax3_colors = itertools.cycle(clrs)
-            ax3_symbols = itertools.cycle(symbols)
-            
-            # get rvs and plot them
-            for i, name in enumerate(inds.keys()):
-                inst_data=rv_data[inds[name]]
-                rvs=inst_data['quant1']
-                epochs=inst_data['epoch']
-                epochs=Time(epochs, format='mjd').decimalyear
-                # don't include this so we can plot more orbits
-                #rvs -= med_ga[i]
-                #rvs -= best_post[results.param_idx[gams[i]]]
-                plt.scatter(epochs, rvs, s=30, marker=next(ax3_symbols), c='blue', label=name, zorder=5)
-                plt.errorbar(x=epochs, y=rvs, yerr=inst_data['quant1_err'], ecolor='blue', zorder=5, ls='none')
-            if len(inds.keys()) == 1 and 'defrv' in inds.keys():
-                pass
-            else:
-                plt.legend(fontsize=20)
-            
-            ## calculate the predicted rv trend using the best orbit 
-            #_, _, vz = kepler.calc_orbit(
-            #    epochs_seppa[0, :], 
-            #    best_post[results.standard_param_idx['sma{}'.format(object_to_plot)]], 
-            #    best_post[results.standard_param_idx['ecc{}'.format(object_to_plot)]], 
-            #    best_post[results.standard_param_idx['inc{}'.format(object_to_plot)]], 
-            #    best_post[results.standard_param_idx['aop{}'.format(object_to_plot)]], 
-            #    best_post[results.standard_param_idx['pan{}'.format(object_to_plot)]], 
-            #    best_post[results.standard_param_idx['tau{}'.format(object_to_plot)]], 
-            #    best_post[results.standard_param_idx['plx']], best_mtot, 
-            #    tau_ref_epoch=results.tau_ref_epoch, mass_for_Kamp=best_m0
-            #)
-            #
-            #
-            ## scale to the RV semiampltude of primary
-            #vz=vz*-(best_m1)/np.median(best_m0)
-            #
-            ## plot rv trend
-            #plt.plot(Time(epochs_seppa[0, :],format='mjd').decimalyear, vz, color=sep_pa_color)
-
-        if (rv_time_series2 == True):
-            if (rv_time_series == False):
-                # get list of rv instruments
-                insts = np.unique(rv_data['instrument'])
-                if len(insts) == 0:
-                    insts = ['defrv']
-
-                # get gamma/sigma labels and corresponding positions in the posterior
-                gams=['gamma_'+inst for inst in insts]
-
-                if isinstance(results.labels,list):
-                    labels=np.array(results.labels)
-                else:
-                    labels=results.labels
-            
-                # get the indices corresponding to each gamma within results.labels
-                gam_idx=[np.where(labels==inst_gamma)[0] for inst_gamma in gams]
-
-                # indices corresponding to each instrument in the datafile
-                inds={}
-                for i in range(len(insts)):
-                    inds[insts[i]]=np.where(rv_data['instrument']==insts[i].encode())[0]
+            best_m0 = best_post[m0_idx]
+            best_m1 = best_post[m1_idx]
 
-                # choose the orbit with the best log probability
-                best_like=np.where(results.lnlike==np.amax(results.lnlike))[0][0]
-                med_ga=[results.post[best_like,i] for i in gam_idx]
+        if (rv_time_series == True):
 
-                # Get the posteriors for this index and convert to standard basis
-                best_post = results.basis.to_standard_basis(results.post[best_like].copy())
+            # marker of each instrument and of each of its rv points
+            rv_markers, rv_point_markers = _group_styles(inds, len(rv_data), _RV_SYMBOLS)
 
-                # Get the masses for the best posteriors:
-                best_m0 = best_post[results.standard_param_idx['m0']]
-                best_m1 = best_post[results.standard_param_idx['m{}'.format(object_to_plot)]]
-                best_mtot = best_m0 + best_m1
+            # get rvs and plot them, one scatter per marker rather than per instrument
+            rvs=np.asarray(rv_data['quant1'])
+            rv_errs=np.asarray(rv_data['quant1_err'])
+            _scatter_by_marker(
+                ax3, rv_yr_epochs, rvs, 'blue', rv_point_markers, s=30, zorder=5, rasterized=True
+            )
+            _plot_errorbars(
+                ax3, rv_yr_epochs, rvs, rv_errs, 'blue', zorder=5, rasterized=True
+            )
+            if show_rv_legend:
+                rv_handles = [
+                    Line2D(
+                        [], [], linestyle='', markersize=np.sqrt(30), markeredgewidth=1.5,
+                        marker=m, color='blue', label=name
+                    )
+                    for name, m in zip(inds.keys(), rv_markers)
+                ]
+                ax3.legend(handles=rv_handles, fontsize=20)
+
+            if plot_best_orbit:
+                _plot_best_rv_trend(
+                    ax3, epochs_rv, yr_epochs_rv, best_post, orbit_cols, best_m0, best_m1,
+                    best_post[results.standard_param_idx['gamma_'+primary_instrument_name]],
+                    results.tau_ref_epoch
+                )
 
-                # colour/shape scheme scheme for rv data points
-                clrs=('#0496FF','#372554','#FF1053','#3A7CA5','#143109')
-                symbols=('o','^','v','s')
+        if (rv_time_series2 == True):
+            # Indices corresponding to each rv2 instrument in datafile
+            inds2 = _group_indices(rv_data2['instrument'])
 
-                ax3_colors = itertools.cycle(clrs)
-                ax3_symbols = itertools.cycle(symbols)
-            
-            rv_data2 = results.data[results.data['object'] == 1]
-            rv_data2 = rv_data2[rv_data2['quant_type'] == 'rv']
-            
-            # get list of rv2 instruments
-            insts2 = np.unique(rv_data2['instrument'])
-            
-            inds2={}
-            for i in range(len(insts2)):
-                inds2[insts2[i]]=np.where(rv_data2['instrument']==insts2[i].encode())[0]
-            
+            # marker of each rv2 instrument and of each of its points, carrying
+            # on from the markers of the primary rv instruments if they are plotted
             if (rv_time_series == True):
-                plt.sca(ax4)
+                rv2_markers, rv2_point_markers = _group_styles(
+                    inds2, len(rv_data2), _RV_SYMBOLS, offset=len(inds)
+                )
+                rv2_ax = ax4
             else:
-                plt.sca(ax3)
+                rv2_markers, rv2_point_markers = _group_styles(inds2, len(rv_data2), _RV_SYMBOLS)
+                rv2_ax = ax3
             
-            # get rvs and plot them
-            for i, name in enumerate(inds2.keys()):
-                inst_data2=rv_data2[inds2[name]]
-                rvs2=inst_data2['quant1']
-                epochs2=inst_data2['epoch']
-                epochs2=Time(epochs2, format='mjd').decimalyear
-                # don't include this so we can plot more orbits
-                #rvs -= med_ga[i]
-                #rvs -= best_post[results.param_idx[gams[i]]]
-                plt.scatter(epochs2, rvs2, s=30, marker=next(ax3_symbols), c='blue', label=name.replace('_', ' '), zorder=5)
-                plt.errorbar(x=epochs2, y=rvs2, yerr=inst_data2['quant1_err'], ecolor='blue', zorder=5, ls='none')
-            if len(inds.keys()) == 1 and 'defrv' in inds.keys():
-                pass
-            else:
-                plt.legend(fontsize=20, loc=2)
+            # get rvs and plot them, one scatter per marker rather than per instrument
+            rvs2=np.asarray(rv_data2['quant1'])
+            rv2_errs=np.asarray(rv_data2['quant1_err'])
+            _scatter_by_marker(
+                rv2_ax, rv2_yr_epochs, rvs2, 'blue', rv2_point_markers, s=30, zorder=5, rasterized=True
+            )
+            _plot_errorbars(
+                rv2_ax, rv2_yr_epochs, rvs2, rv2_errs, 'blue', zorder=5, rasterized=True
+            )
+            if show_rv_legend:
+                rv2_handles = [
+                    Line2D(
+                        [], [], linestyle='', markersize=np.sqrt(30), markeredgewidth=1.5,
+                        marker=m, color='blue', label=name.replace('_', ' ')
+                    )
+                    for name, m in zip(inds2.keys(), rv2_markers)
+                ]
+                rv2_ax.legend(handles=rv2_handles, fontsize=20, loc=2)
         
         # add colorbar
         if show_colorbar:
-            if (rv_time_series == True) or (rv_time_series2 == True):
-                # Create an axes for colorbar. The position of the axes is calculated based on the position of ax.
-                # You can change x1.0.05 to adjust the distance between the main image and the colorbar.
-                # You can change 0.02 to adjust the width of the colorbar.
-                cbar_ax = fig.add_axes(
-                    [ax.get_position().x1+0.005, ax.get_position().y0, 0.02, ax.get_position().height])
-                cbar = mpl.colorbar.ColorbarBase(
-                    cbar_ax, cmap=cmap, norm=norm_yr, orientation='vertical', label=cbar_param)
-                cbar.ax.tick_params(labelsize=15)
-                cbar.set_label(label=cbar_param, size=20)
-            else:
-                # xpos, ypos, width, height, in fraction of figure size
-                cbar_ax = fig.add_axes([0.47, 0.15, 0.015, 0.7])
-                cbar = mpl.colorbar.ColorbarBase(
-                    cbar_ax, cmap=cmap, norm=norm_yr, orientation='vertical', label=cbar_param)
-                cbar.ax.tick_params(labelsize=15)
-                cbar.set_label(label=cbar_param, size=20)
+            # Take the space for the colorbar from the right of the orbit plot, so that
+            # it follows ax through the layout rather than sitting at a fixed position.
+            # You can change pad to adjust the distance between the plot and the colorbar.
+            # You can change fraction to adjust the width of the colorbar.
+            sm = mpl.cm.ScalarMappable(norm=norm_yr, cmap=cmap)
+            cbar = fig.colorbar(
+                sm, ax=ax, fraction=0.08, pad=0.02, orientation='vertical', label=cbar_param
+            )
+            cbar.ax.tick_params(labelsize=15)
+            cbar.set_label(label=cbar_param, size=20)
 
         # hard code custom things
         #ax2.set_xlim(2000, 2025)
@@ -799,13 +949,9 @@ def plot_orbits(results, object_to_plot=1, start_mjd=51544.,
         ax2.locator_params(axis='x', nbins=6)
         ax2.locator_params(axis='y', nbins=6)
         
-        for ax1 in fig.get_axes():
-            ax1.tick_params(axis='both', labelsize=15)
-            ax1.minorticks_on()
-            
-        for ax2 in fig.get_axes():
-            ax2.tick_params(axis='both', labelsize=15)
-            ax2.minorticks_on()
+        for fig_ax in fig.get_axes():
+            fig_ax.tick_params(axis='both', labelsize=15)
+            fig_ax.minorticks_on()
     
     fig.tight_layout()
 
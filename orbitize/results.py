@@ -307,11 +307,13 @@ class Results(object):
             )
         print('-------------------\n')
     
-    def plot_corner(self, param_list=None, **corner_kwargs):
+    def plot_corner(self, param_list=None, max_samples=50000, **corner_kwargs):
         """
         Wrapper for orbitize.plot.plot_corner
         """
-        return orbitize.plot.plot_corner(self, param_list, **corner_kwargs)
+        return orbitize.plot.plot_corner(
+            self, param_list, max_samples=max_samples, **corner_kwargs
+        )
 
     def plot_orbits(self, object_to_plot=1, start_mjd=51544.,
         num_orbits_to_plot=100, num_epochs_to_plot=100,
@@ -320,7 +322,7 @@ class Results(object):
         cbar_param='Epoch [year]', mod180=False, rv_time_series=False, 
         plot_astrometry=True,
         plot_astrometry_insts=False,
-        plot_errorbars=True, fig=None
+        plot_errorbars=True, fig=None, rng=None, plot_best_orbit=False
     ):
         """
         Wrapper for orbitize.plot.plot_orbits
@@ -334,8 +336,8 @@ class Results(object):
             sep_pa_color=sep_pa_color, sep_pa_end_year=sep_pa_end_year,
             cbar_param=cbar_param, mod180=mod180, rv_time_series=rv_time_series, 
             plot_astrometry=plot_astrometry,
-            plot_astrometry_insts=plot_astrometry_insts, 
-            plot_errorbars=plot_errorbars, fig=fig
+            plot_astrometry_insts=plot_astrometry_insts, fig=fig,
+            rng=rng, plot_best_orbit=plot_best_orbit
         )
 
 
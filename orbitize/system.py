@@ -651,13 +651,13 @@ def transform_errors(x1, x2, x1_err, x2_err, x12_corr, transform_func, nsamps=10
     apporach
     
    Args:
-        x1 (float): planet location in first coordinate (e.g., RA, sep) before 
+        x1 (float or np.array): planet location in first coordinate (e.g., RA, sep) before
             transformation
-        x2 (float): planet location in the second coordinate (e.g., Dec, PA) 
+        x2 (float or np.array): planet location in the second coordinate (e.g., Dec, PA)
             before transformation)
-        x1_err (float): error in x1
-        x2_err (float): error in x2
-        x12_corr (float): correlation between x1 and x2
+        x1_err (float or np.array): error in x1
+        x2_err (float or np.array): error in x2
+        x12_corr (float or np.array): correlation between x1 and x2
         transform_func (function): function that transforms between (x1, x2) 
             and (x1p, x2p) (the transformed coordinates). The function signature 
             should look like: `x1p, x2p = transform_func(x1, x2)`
@@ -665,21 +665,45 @@ def transform_errors(x1, x2, x1_err, x2_err, x12_corr, transform_func, nsamps=10
             More is slower but more accurate. 
     Returns:
         tuple (x1p_err, x2p_err, x12p_corr): the errors and correlations for 
-            x1p,x2p (the transformed coordinates)
+            x1p,x2p (the transformed coordinates). Arrays if the inputs are arrays
+            (one entry per point), floats otherwise.
     """
 
-    if np.isnan(x12_corr):
-        x12_corr = 0.
-
-    # construct covariance matrix from the terms provided
-    cov = np.array([[x1_err**2, x1_err*x2_err*x12_corr], [x1_err*x2_err*x12_corr, x2_err**2]])
-
-    samps = np.random.multivariate_normal([x1, x2], cov, size=nsamps)
+    x1, x2, x1_err, x2_err, x12_corr = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (x1, x2, x1_err, x2_err, x12_corr))
+    )
+    shape = x1.shape
+    x1, x2, x1_err, x2_err, x12_corr = (
+        np.ravel(x) for x in (x1, x2, x1_err, x2_err, x12_corr)
+    )
+    x12_corr = np.where(np.isnan(x12_corr), 0., x12_corr)
+
+    x1p_err = np.empty(x1.size)
+    x2p_err = np.empty(x1.size)
+    x12p_corr = np.empty(x1.size)
+
+    # draw correlated samples (using the Cholesky decomposition of each 2x2
+    # covariance matrix) for a block of points at a time, so that at most
+    # ~1e6 samples are held in memory however many points are passed in
+    block = max(1, int(1e6) // nsamps)
+    for start in range(0, x1.size, block):
+        pts = slice(start, start + block)
+
+        z1, z2 = np.random.normal(size=(2, nsamps, len(x1[pts])))
+        samps1 = x1[pts] + x1_err[pts]*z1
+        samps2 = x2[pts] + x2_err[pts]*(
+            x12_corr[pts]*z1 + np.sqrt(1. - x12_corr[pts]**2)*z2
+        )
 
-    x1p, x2p = transform_func(samps[:,0], samps[:, 1])
+        x1p, x2p = transform_func(samps1, samps2)
 
-    x1p_err = np.std(x1p)
-    x2p_err = np.std(x2p)
-    x12_corr = np.corrcoef([x1p, x2p])[0,1]
+        x1p_err[pts] = np.std(x1p, axis=0)
+        x2p_err[pts] = np.std(x2p, axis=0)
+        x12p_corr[pts] = np.mean(
+            (x1p - np.mean(x1p, axis=0))*(x2p - np.mean(x2p, axis=0)), axis=0
+        ) / (x1p_err[pts]*x2p_err[pts])
 
-    return x1p_err, x2p_err, x12_corr
+    return (
+        x1p_err.reshape(shape)[()], x2p_err.reshape(shape)[()],
+        x12p_corr.reshape(shape)[()]
+    )
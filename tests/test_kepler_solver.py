@@ -208,6 +208,39 @@ def test_orbit_with_mass_array():
         for meas, truth in zip(vzs[:, ii], true_vz[:, ii]):
             assert truth == pytest.approx(meas, abs=1e-8)
 
+def test_orbit_per_orbit_epochs():
+    """
+    Test orbitize.kepler.calc_orbit() with a 2-D array of epochs (a different set of epochs
+    for each orbit) against solving each orbit separately
+    """
+    # sma, ecc, inc, argp, lan, tau, plx, mtot
+    sma = np.array([10, 5, 20])
+    ecc = np.array([0.3, 0.1, 0.6])
+    inc = np.array([3, 1, 2])
+    argp = np.array([0.5, 1.5, 2.5])
+    lan = np.array([1.5, 0.5, 3])
+    tau = np.array([0.3, 0.7, 0.1])
+    plx = np.array([50, 50, 50])
+    mtot = np.array([1.5, 1.2, 1.8])
+    epochs = np.array([[1000, 2000, 3000], [1101.4, 5000, 9000]])
+    raoffs, deoffs, vzs = kepler.calc_orbit(
+        epochs, sma, ecc, inc, argp, lan, tau, plx, mtot, tau_ref_epoch=0
+    )
+
+    assert raoffs.shape == epochs.shape
+
+    for ii in range(0,3):
+        true_raoff, true_deoff, true_vz = kepler.calc_orbit(
+            epochs[:, ii], sma[ii], ecc[ii], inc[ii], argp[ii], lan[ii], tau[ii], plx[ii], mtot[ii],
+            tau_ref_epoch=0
+        )
+        for meas, truth in zip(raoffs[:, ii], true_raoff):
+            assert truth == pytest.approx(meas, abs=threshold)
+        for meas, truth in zip(deoffs[:, ii], true_deoff):
+            assert truth == pytest.approx(meas, abs=threshold)
+        for meas, truth in zip(vzs[:, ii], true_vz):
+            assert truth == pytest.approx(meas, abs=1e-8)
+
 def test_orbit_scalar():
     """
     Test orbitize.kepler.calc_orbit() with scalar values
@@ -216,6 +216,25 @@ def test_plot_corner(results_to_test):
 
     results_to_test.post[:, -1] = mass_vals
 
+    # test that fixing a parameter ahead of the angles keeps labels and unit
+    # conversions lined up with the remaining parameters
+    ecc_vals = results_to_test.post[:, 1].copy()
+    results_to_test.post[:, 1] = 0.0
+    Figure4 = results_to_test.plot_corner(param_list=["sma1", "ecc1", "inc1"])
+    assert Figure4.axes[-1].get_xlabel() == "$inc_1$ [$^\\circ$]"
+    assert np.median(results_to_test.post[:, 2]) < np.mean(Figure4.axes[-1].get_xlim())
+
+    results_to_test.post[:, 1] = ecc_vals
+
+    # test that long posteriors are thinned to at most max_samples samples
+    # (each 1-D histogram is a step outline with every bin count listed twice)
+    Figure5 = results_to_test.plot_corner(param_list=["sma1", "ecc1"], max_samples=1000)
+    assert np.sum(Figure5.axes[0].patches[0].get_xy()[:, 1]) / 2 == 1000
+    Figure6 = results_to_test.plot_corner(param_list=["sma1", "ecc1"], max_samples=None)
+    assert np.sum(Figure6.axes[0].patches[0].get_xy()[:, 1]) / 2 == len(
+        results_to_test.post
+    )
+
     return Figure1, Figure2, Figure3
 
 
@@ -246,6 +265,89 @@ def test_plot_orbits(results_to_test):
     return (Figure1, Figure2, Figure3, Figure4, Figure5)
 
 
+def test_plot_orbits_rng(results_to_test):
+    """
+    Tests that plot_orbits() picks the same orbits for equally seeded Generators
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    def plotted_tracks(seed):
+        fig = results_to_test.plot_orbits(
+            num_orbits_to_plot=5, rng=np.random.default_rng(seed)
+        )
+        tracks = [
+            np.concatenate(collection.get_segments())
+            for ax in fig.axes
+            for collection in ax.collections
+            if isinstance(collection, LineCollection) and collection.get_segments()
+        ]
+        plt.close(fig)
+        return np.concatenate(tracks)
+
+    assert np.array_equal(plotted_tracks(3), plotted_tracks(3))
+    assert not np.array_equal(plotted_tracks(3), plotted_tracks(4))
+
+
+def test_compute_orbit_tracks():
+    """
+    Tests the orbit tracks computed for plot_orbits() without any plotting
+    """
+    import orbitize.plot
+
+    sma = np.array([10.0, 20.0])
+    ecc = np.array([0.1, 0.5])
+    inc = np.array([1.0, 0.5])
+    aop = np.array([0.5, 2.0])
+    pan = np.array([1.0, 3.0])
+    tau = np.array([0.3, 0.7])
+    plx = np.array([50.0, 50.0])
+    mtot = np.array([1.0, 1.5])
+
+    (
+        raoff,
+        deoff,
+        epochs,
+        raoff_seppa,
+        deoff_seppa,
+        vz,
+        epochs_seppa,
+        epochs_rv,
+    ) = orbitize.plot._compute_orbit_tracks(
+        sma, ecc, inc, aop, pan, tau, plx, mtot, 51544.0, 50, 60000.0, 58849
+    )
+
+    assert raoff.shape == deoff.shape == epochs.shape == (2, 50)
+    assert raoff_seppa.shape == deoff_seppa.shape == vz.shape == (2, 50)
+    assert epochs_seppa.shape == (50,)
+    assert np.array_equal(epochs_rv, epochs_seppa)
+
+    # the sky plot tracks cover exactly one orbital period
+    assert np.all(epochs[:, 0] == 51544.0)
+    assert raoff[:, -1] == pytest.approx(raoff[:, 0], abs=1e-6)
+    assert deoff[:, -1] == pytest.approx(deoff[:, 0], abs=1e-6)
+
+    # both sets of tracks start at the same position
+    assert raoff_seppa[:, 0] == pytest.approx(raoff[:, 0])
+    assert deoff_seppa[:, 0] == pytest.approx(deoff[:, 0])
+    assert epochs_seppa[-1] == 60000.0
+
+    # the rv tracks are solved on their own epochs when a start is given
+    tracks = orbitize.plot._compute_orbit_tracks(
+        sma, ecc, inc, aop, pan, tau, plx, mtot, 51544.0, 50, 60000.0, 58849,
+        mass_for_Kamp=mtot, rv_start_mjd=50000.0
+    )
+    vz_rv, epochs_rv = tracks[5], tracks[7]
+    assert epochs_rv[0] == 50000.0
+    assert epochs_rv[-1] == 60000.0
+    for i in range(len(sma)):
+        _, _, vz_expected = orbitize.kepler.calc_orbit(
+            epochs_rv, sma[i], ecc[i], inc[i], aop[i], pan[i], tau[i], plx[i],
+            mtot[i], mass_for_Kamp=mtot[i], tau_ref_epoch=58849
+        )
+        assert vz_rv[i] == pytest.approx(vz_expected)
+
+
 def test_save_and_load_hipparcos_only():
     """
     Test that a Results object for a Hipparcos-only fit (i.e. no Gaia data)
@@ -1,4 +1,8 @@
-from orbitize import driver, DATADIR
+from orbitize import driver, read_input, system, results, DATADIR
+import orbitize.plot
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
 import multiprocessing as mp
 
 
@@ -124,6 +128,149 @@ def test_rv_multiple_inst():
     )
 
 
+def hr7672_results(secondary_rvs=False):
+    """
+    Returns a results.Results object for HR 7672 with simulated posterior
+    samples, optionally adding a few rvs of the companion
+    """
+    data = read_input.read_file("{}/HR7672_joint.csv".format(DATADIR))
+    if secondary_rvs:
+        for epoch, rv in zip([55000.0, 56000.0, 57000.0], [1.5, 0.5, -1.0]):
+            data.add_row(
+                [epoch, 1, rv, 0.2, np.nan, np.nan, np.nan, "rv", "defrv"]
+            )
+
+    test_system = system.System(
+        1, data, 1.08, 56.2, mass_err=0.04, plx_err=0.01,
+        fit_secondary_mass=True, tau_ref_epoch=0
+    )
+
+    # parameters roughly based on HR 7672 B from Brandt+ 2019
+    values = {
+        "sma1": 18.3,
+        "ecc1": 0.5,
+        "inc1": np.radians(97.3),
+        "aop1": np.radians(259.0),
+        "pan1": np.radians(241.0),
+        "tau1": 0.6,
+        "plx": 56.2,
+        "m1": 0.07,
+        "m0": 1.08,
+    }
+    n_orbits = 200
+    sim_post = np.zeros((n_orbits, len(test_system.labels)))
+    for i, label in enumerate(test_system.labels):
+        if label.startswith("gamma"):
+            sim_post[:, i] = np.random.normal(0.0, 0.01, n_orbits)
+        elif label.startswith("sigma"):
+            sim_post[:, i] = np.random.uniform(0.001, 0.01, n_orbits)
+        else:
+            sim_post[:, i] = np.random.normal(
+                values[label], 0.01*abs(values[label]), n_orbits
+            )
+
+    return results.Results(
+        test_system, sampler_name="MCMC", post=sim_post,
+        lnlike=np.random.uniform(size=n_orbits)
+    )
+
+
+def test_plot_rv_panels():
+    """
+    Tests orbitize.plot.plot_orbits with the primary and/or companion rv panels,
+    with and without plotting the astrometry by instrument
+    """
+    test_results = hr7672_results(secondary_rvs=True)
+    rv_data = test_results.data[test_results.data["quant_type"] == "rv"]
+    n_rvs = {
+        "Primary RV (km/s)": np.sum(rv_data["object"] == 0),
+        "Companion RV (km/s)": np.sum(rv_data["object"] == 1),
+    }
+
+    for rv_time_series, rv_time_series2 in [(True, False), (False, True), (True, True)]:
+        for plot_astrometry_insts in [False, True]:
+            fig = orbitize.plot.plot_orbits(
+                test_results,
+                num_orbits_to_plot=5,
+                rv_time_series=rv_time_series,
+                rv_time_series2=rv_time_series2,
+                plot_astrometry_insts=plot_astrometry_insts,
+            )
+
+            rv_axes = [ax for ax in fig.axes if ax.get_ylabel() in n_rvs]
+            assert len(rv_axes) == rv_time_series + rv_time_series2
+            for ax in rv_axes:
+                # one orbit track per plotted orbit, and every rv point drawn
+                tracks = ax.collections[0].get_segments()
+                assert len(tracks) == 5
+                n_points = sum(
+                    len(collection.get_offsets())
+                    for collection in ax.collections[1:]
+                    if not hasattr(collection, "get_segments")
+                )
+                assert n_points == n_rvs[ax.get_ylabel()]
+
+            plt.close(fig)
+
+
+def test_plot_best_orbit():
+    """
+    Tests that the rv curve of the best orbit plotted by orbitize.plot.plot_orbits
+    lies on the rv track of that same orbit
+    """
+    test_results = hr7672_results()
+    # every posterior sample is the same orbit
+    test_results.post[:] = test_results.post[0]
+
+    fig = orbitize.plot.plot_orbits(
+        test_results,
+        num_orbits_to_plot=1,
+        rv_time_series=True,
+        plot_best_orbit=True,
+    )
+    rv_ax = [ax for ax in fig.axes if ax.get_ylabel() == "Primary RV (km/s)"][0]
+
+    track = rv_ax.collections[0].get_segments()[0]
+    best_orbit = rv_ax.lines[-1].get_xydata()
+    assert best_orbit == pytest.approx(track)
+
+    plt.close(fig)
+
+
+def test_plot_square_with_colorbar():
+    """
+    Tests that the colorbar of orbitize.plot.plot_orbits leaves the orbit plot
+    square: full height, with the data limits expanded to fill it
+    """
+    test_results = hr7672_results()
+
+    def orbit_axes(square_plot, show_colorbar):
+        fig = orbitize.plot.plot_orbits(
+            test_results,
+            num_orbits_to_plot=5,
+            square_plot=square_plot,
+            show_colorbar=show_colorbar,
+            rng=np.random.default_rng(1),
+        )
+        fig.canvas.draw()
+        ax = fig.axes[0]
+        height = ax.get_position().height
+        ylim = ax.get_ylim()
+        plt.close(fig)
+        return height, ylim[1] - ylim[0]
+
+    square_height, square_yrange = orbit_axes(True, True)
+    no_cbar_height, no_cbar_yrange = orbit_axes(True, False)
+    not_square_height, not_square_yrange = orbit_axes(False, True)
+
+    assert square_height == pytest.approx(no_cbar_height)
+    assert square_height > not_square_height
+    assert square_yrange > not_square_yrange
+
+
 if __name__ == "__main__":
     test_rv_default_inst()
     test_rv_multiple_inst()
+    test_plot_rv_panels()
+    test_plot_best_orbit()
+    test_plot_square_with_colorbar()
@@ -98,6 +98,75 @@ def test_radec2seppa():
     assert pa_180mod == pytest.approx(pas_expected_180mod, abs=1e-3)
 
 
+def test_transform_errors():
+    """
+    Tests that orbitize.system.transform_errors gives the same answer for an array
+    of measurements as for each measurement on its own, and that it matches
+    linear error propagation for small errors.
+    """
+
+    ras = np.array([100.0, -50.0, 20.0])
+    decs = np.array([10.0, 80.0, -30.0])
+    ra_errs = np.array([1.0, 0.5, 0.2])
+    dec_errs = np.array([0.5, 1.0, 0.3])
+    corrs = np.array([0.0, 0.5, np.nan])
+
+    sep_errs, pa_errs, seppa_corrs = system.transform_errors(
+        ras, decs, ra_errs, dec_errs, corrs, system.radec2seppa
+    )
+
+    assert sep_errs.shape == ras.shape
+
+    for i in range(len(ras)):
+        sep_err, pa_err, seppa_corr = system.transform_errors(
+            ras[i], decs[i], ra_errs[i], dec_errs[i], corrs[i], system.radec2seppa
+        )
+
+        assert np.isscalar(sep_err)
+        assert sep_errs[i] == pytest.approx(sep_err, rel=2e-2)
+        assert pa_errs[i] == pytest.approx(pa_err, rel=2e-2)
+        assert seppa_corrs[i] == pytest.approx(seppa_corr, abs=2e-2)
+
+    # uncorrelated RA/Dec errors along the sep direction map directly to sep errors
+    sep_err, pa_err, seppa_corr = system.transform_errors(
+        100.0, 0.0, 1.0, 0.5, 0.0, system.radec2seppa
+    )
+    assert sep_err == pytest.approx(1.0, rel=2e-2)
+    assert pa_err == pytest.approx(np.degrees(0.5 / 100.0), rel=2e-2)
+    assert seppa_corr == pytest.approx(0.0, abs=2e-2)
+
+
+def test_transform_errors_many_points():
+    """
+    Tests that orbitize.system.transform_errors handles several hundred points
+    (more than fit in one block of samples) and matches linear error
+    propagation for each of them.
+    """
+
+    n_points = 500
+    rng = np.random.default_rng(10)
+    ras = rng.uniform(50.0, 150.0, n_points)
+    decs = rng.uniform(-100.0, 100.0, n_points)
+    ra_errs = rng.uniform(0.1, 1.0, n_points)
+    dec_errs = rng.uniform(0.1, 1.0, n_points)
+    corrs = np.zeros(n_points)
+
+    sep_errs, pa_errs, seppa_corrs = system.transform_errors(
+        ras, decs, ra_errs, dec_errs, corrs, system.radec2seppa, nsamps=20000
+    )
+
+    assert sep_errs.shape == pa_errs.shape == seppa_corrs.shape == (n_points,)
+
+    seps = np.sqrt(ras**2 + decs**2)
+    sep_errs_expected = np.sqrt((ras*ra_errs)**2 + (decs*dec_errs)**2) / seps
+    pa_errs_expected = np.degrees(
+        np.sqrt((decs*ra_errs)**2 + (ras*dec_errs)**2) / seps**2
+    )
+
+    assert sep_errs == pytest.approx(sep_errs_expected, rel=5e-2)
+    assert pa_errs == pytest.approx(pa_errs_expected, rel=5e-2)
+
+
 if __name__ == "__main__":
     test_convert_data_table_radec2seppa()
     test_radec2seppa()